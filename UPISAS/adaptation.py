@@ -1,9 +1,95 @@
+import json
+import time
+
 import requests
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from scipy.optimize import linear_sum_assignment
+from scipy.spatial import cKDTree
 from strategy import Strategy
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Prefer a compiled JSON parser for the monitor payload; both accept the
+# raw response bytes directly, stdlib json is the always-available fallback.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
+if _HAVE_NUMBA:
+    @njit(parallel=True)
+    def _pairwise_close_pairs(positions, squared_radius):
+        """Indices of all point pairs closer than sqrt(squared_radius).
+
+        Two passes (count, then fill) so each row can be processed in
+        parallel without synchronizing on a shared output list.
+        """
+        n = positions.shape[0]
+        counts = np.zeros(n + 1, dtype=np.int64)
+        for i in prange(n):
+            close = 0
+            xi = positions[i, 0]
+            yi = positions[i, 1]
+            for j in range(i + 1, n):
+                dx = xi - positions[j, 0]
+                dy = yi - positions[j, 1]
+                if dx * dx + dy * dy < squared_radius:
+                    close += 1
+            counts[i + 1] = close
+        offsets = np.cumsum(counts)
+        first = np.empty(offsets[-1], dtype=np.int64)
+        second = np.empty(offsets[-1], dtype=np.int64)
+        for i in prange(n):
+            k = offsets[i]
+            xi = positions[i, 0]
+            yi = positions[i, 1]
+            for j in range(i + 1, n):
+                dx = xi - positions[j, 0]
+                dy = yi - positions[j, 1]
+                if dx * dx + dy * dy < squared_radius:
+                    first[k] = i
+                    second[k] = j
+                    k += 1
+        return first, second
+
 
 class AdvancedWildfireAdaptationStrategy(Strategy):
+
+    # All coordinate arrays are quantized to float32: half the memory
+    # traffic and twice the SIMD lanes of float64, with far more precision
+    # than the simulation's unit-scale coordinates need. int16 would halve
+    # it again but cannot represent fractional positions.
+    COORD_DTYPE = np.float32
+
+    # Below this fleet size a plain Python loop on squared distances beats
+    # any array build; no np.sqrt is needed since the comparison radius can
+    # be squared instead.
+    SCALAR_THRESHOLD = 16
+
+    # Below this fleet size the O(N^2) broadcast kernel beats the k-d tree build cost.
+    KDTREE_THRESHOLD = 64
+
+    # Between KDTREE_THRESHOLD and this, a one-pass spatial hash with
+    # security_distance-sized cells is cheaper than building a k-d tree.
+    GRID_THRESHOLD = 512
+
+    # Unit displacement of the fire front per wind direction.
+    WIND_OFFSETS = {
+        "north": (0, -1),
+        "south": (0, 1),
+        "east": (1, 0),
+        "west": (-1, 0),
+    }
+
     def __init__(self, monitor_api, execute_api, adaptation_schema, max_uav_speed=2, collision_distance=10):
         super().__init__()
         self.monitor_api = monitor_api
@@ -12,15 +98,46 @@ class AdvancedWildfireAdaptationStrategy(Strategy):
         self.max_uav_speed = max_uav_speed
         self.collision_distance = collision_distance
         self.observation_radius = 8  # Initial default
+        # Send all adjustments in one bulk PUT; set to False for servers
+        # that only understand one adjustment per request.
+        self.bulk_execute = True
+        self._rng = np.random.default_rng()
+        # Last monitor payload (raw bytes, ETag, preprocessed snapshot):
+        # lets monitor() skip re-parsing when the state has not changed.
+        self._monitor_etag = None
+        self._monitor_raw = None
+        self._monitor_snapshot = None
+        # Collision detector specialized for the current fleet size: the
+        # size-tier branch is resolved and the scratch buffers allocated
+        # once, then reused every tick until the fleet size changes.
+        self._fleet_size = None
+        self._collision_detector = None
+        # Pooled session with keep-alive: one TCP connection is reused across
+        # all monitor/execute calls instead of a fresh handshake per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=3)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def monitor(self):
         """
         Fetch data from the /monitor API endpoint and preprocess it for decision-making.
         """
-        response = requests.get(self.monitor_api)
+        headers = {}
+        if self._monitor_etag:
+            headers["If-None-Match"] = self._monitor_etag
+        response = self._session.get(self.monitor_api, headers=headers)
+        if response.status_code == 304 and self._monitor_snapshot is not None:
+            # Server confirmed the state is unchanged; no body to parse.
+            return self._monitor_snapshot
         if response.status_code != 200:
             raise Exception(f"Monitor API Error: {response.status_code}")
-        data = response.json()
+        raw = response.content
+        if raw == self._monitor_raw and self._monitor_snapshot is not None:
+            # Identical payload: reuse the preprocessed snapshot and skip
+            # the JSON parse and array rebuilds.
+            return self._monitor_snapshot
+        data = _json_loads(raw)
 
         # Extract constants and dynamic values
         constants = data.get("constants", {})
@@ -37,36 +154,66 @@ class AdvancedWildfireAdaptationStrategy(Strategy):
         smoke_active = constants.get("activateSmoke", False)
         fire_spread_speed = constants.get("fireSpreadSpeed", 2)
 
-        return {
+        # Structure-of-arrays view of the fleet coordinates, built once per
+        # tick so the analysis/planning kernels operate on contiguous data
+        # instead of a list of dicts.
+        uav_xy = np.asarray([[uav["x"], uav["y"]] for uav in uav_details], dtype=self.COORD_DTYPE)
+        uav_xy = uav_xy.reshape(-1, 2)  # Keep (0, 2) shape for an empty fleet
+
+        snapshot = {
             "uav_details": uav_details,
+            "uav_xy": uav_xy,
             "fire_zones": fire_zones,
             "wind": wind,
             "smoke_active": smoke_active,
             "fire_spread_speed": fire_spread_speed,
         }
+        self._monitor_etag = response.headers.get("ETag")
+        self._monitor_raw = raw
+        self._monitor_snapshot = snapshot
+        return snapshot
 
     def analyze(self, data):
         """
         Analyze the current state and determine necessary adjustments.
         """
         uav_details = data["uav_details"]
+        uav_xy = data.get("uav_xy")
+        if uav_xy is None:
+            uav_xy = np.asarray([[uav["x"], uav["y"]] for uav in uav_details],
+                                dtype=self.COORD_DTYPE).reshape(-1, 2)
         fire_zones = data["fire_zones"]
         wind = data["wind"]
         fire_spread_speed = data["fire_spread_speed"]
 
+        # Zone coordinates are stacked once here and reused by every kernel
+        # in this tick (prioritization now, allocation in plan()).
+        zones_xy = None
+        if fire_zones:
+            zones_xy = np.asarray([[zone["x"], zone["y"]] for zone in fire_zones],
+                                  dtype=self.COORD_DTYPE)
+
         # Step 1: Prioritize fire zones
-        prioritized_zones = self.prioritize_fire_zones(fire_zones, uav_details)
+        prioritized_zones = self.prioritize_fire_zones(fire_zones, uav_details,
+                                                       uav_xy=uav_xy, zones_xy=zones_xy)
 
         # Step 2: Predict fire spread
         predicted_zones = self.predict_fire_spread(wind, fire_zones)
 
-        # Step 3: Detect potential collisions
-        collision_warnings = self.detect_collisions(uav_details, self.collision_distance)
+        # Step 3: Detect potential collisions with the detector specialized
+        # for this fleet size
+        if self._fleet_size != len(uav_details):
+            self._fleet_size = len(uav_details)
+            self._collision_detector = self._make_collision_detector(self._fleet_size)
+        collision_warnings = self._collision_detector(uav_details, uav_xy)
 
         # Step 4: Adjust observation radius dynamically
         self.adjust_observation_radius(fire_spread_speed)
 
         return {
+            "uav_details": uav_details,
+            "uav_xy": uav_xy,
+            "zones_xy": zones_xy,
             "prioritized_zones": prioritized_zones,
             "predicted_zones": predicted_zones,
             "collision_warnings": collision_warnings,
@@ -77,59 +224,123 @@ class AdvancedWildfireAdaptationStrategy(Strategy):
         Plan UAV movements and configurations to optimize wildfire tracking and collision avoidance.
         """
         uav_details = analysis_results.get("uav_details")
+        uav_xy = analysis_results.get("uav_xy")
+        zones_xy = analysis_results.get("zones_xy")
         prioritized_zones = analysis_results.get("prioritized_zones")
         collision_warnings = analysis_results.get("collision_warnings")
 
         # Allocate UAVs to prioritized fire zones
-        assignments = self.allocate_uavs(prioritized_zones, uav_details)
+        assignments = self.allocate_uavs(prioritized_zones, uav_details,
+                                         uav_xy=uav_xy, zones_xy=zones_xy)
 
-        # Resolve collisions
+        # Resolve collisions; one bulk RNG draw covers the evasive offsets
+        # for every involved UAV instead of a scalar draw per coordinate.
         collision_resolutions = []
-        for collision in collision_warnings:
-            collision_resolutions.extend(self.resolve_collision(collision[0], collision[1]))
+        if collision_warnings:
+            offsets = self._rng.choice((-1, 1), size=(len(collision_warnings), 2, 2))
+            resolve = self.resolve_collision
+            extend = collision_resolutions.extend
+            for collision, pair_offsets in zip(collision_warnings, offsets):
+                extend(resolve(collision[0], collision[1], offsets=pair_offsets))
 
-        # Combine assignments and collision resolutions
-        return assignments + collision_resolutions
+        # Combine assignments and collision resolutions, keeping one
+        # adjustment per UAV. Assignments arrive in priority order, so the
+        # first one for a UAV wins: an overflow zone falling back on an
+        # already-assigned UAV must not steal it from the zone the solver
+        # gave it to. Collision resolutions then override regardless -
+        # evasion wins over coverage.
+        merged = {}
+        for adjustment in assignments:
+            merged.setdefault(adjustment["id"], adjustment)
+        for adjustment in collision_resolutions:
+            merged[adjustment["id"]] = adjustment
+        return list(merged.values())
 
     def execute(self, adjustments):
         """
         Execute the planned adjustments by sending them to the /execute API endpoint.
         """
-        for adj in adjustments:
-            response = requests.put(self.execute_api, json=adj)
+        if not adjustments:
+            return
+        if self.bulk_execute:
+            # One PUT carrying the whole batch: amortizes framing, JSON
+            # serialization and server dispatch over all adjustments.
+            response = self._session.put(self.execute_api, json={"batch": adjustments})
+            if response.status_code != 200:
+                raise Exception(f"Execution API Error: {response.status_code}")
+            return
+        # Adjustments are independent per UAV; issuing them concurrently
+        # collapses the wall time from M round trips to roughly one.
+        with ThreadPoolExecutor(max_workers=min(16, len(adjustments))) as executor:
+            responses = list(executor.map(
+                lambda adj: self._session.put(self.execute_api, json=adj),
+                adjustments,
+            ))
+        for response in responses:
             if response.status_code != 200:
                 raise Exception(f"Execution API Error: {response.status_code}")
 
-    def prioritize_fire_zones(self, fire_zones, uav_positions):
+    def step(self):
         """
-        Prioritize fire zones based on intensity, proximity, and UAV coverage.
+        Run one monitor-analyze-plan-execute pass and return the adjustments sent.
         """
-        priorities = []
-        for zone in fire_zones:
-            distance_to_nearest_uav = min(
-                np.linalg.norm(np.array([zone["x"], zone["y"]]) - np.array([uav["x"], uav["y"]]))
-                for uav in uav_positions
-            )
-            priority_score = zone["intensity"] / (distance_to_nearest_uav + 1)  # Avoid division by zero
-            priorities.append({"zone": zone, "priority": priority_score})
+        data = self.monitor()
+        analysis_results = self.analyze(data)
+        adjustments = self.plan(analysis_results)
+        self.execute(adjustments)
+        return adjustments
+
+    def run(self, num_ticks=None, interval=0.0):
+        """
+        Drive the MAPE-K loop in a single process for num_ticks ticks (forever if None).
 
+        Everything stays in this interpreter: the pooled session, the monitor
+        snapshot cache and the per-tick coordinate arrays are all reused from
+        one tick to the next, and the heavy lifting happens inside the
+        vectorized kernels rather than across worker processes.
+        """
+        ticks = 0
+        while num_ticks is None or ticks < num_ticks:
+            self.step()
+            ticks += 1
+            if interval > 0:
+                time.sleep(interval)
+        return ticks
+
+    def prioritize_fire_zones(self, fire_zones, uav_positions, uav_xy=None, zones_xy=None):
+        """
+        Prioritize fire zones based on intensity, proximity, and UAV coverage.
+        """
+        if not fire_zones:
+            return []
+        if zones_xy is None:
+            zones_xy = np.asarray([[zone["x"], zone["y"]] for zone in fire_zones],
+                                  dtype=self.COORD_DTYPE)
+        uavs_xy = uav_xy if uav_xy is not None else np.asarray(
+            [[uav["x"], uav["y"]] for uav in uav_positions], dtype=self.COORD_DTYPE)
+        # (Z, U) distance matrix in one broadcast; min over UAVs per zone.
+        diff = zones_xy[:, None, :] - uavs_xy[None, :, :]
+        nearest_distances = np.sqrt(np.einsum("zuk,zuk->zu", diff, diff)).min(axis=1)
+        intensities = np.asarray([zone["intensity"] for zone in fire_zones], dtype=self.COORD_DTYPE)
+        scores = intensities / (nearest_distances + 1)  # Avoid division by zero
+        priorities = [
+            # "index" records the zone's row in zones_xy so later stages can
+            # reuse the cached array in prioritized order.
+            {"zone": zone, "priority": float(score), "index": index}
+            for index, (zone, score) in enumerate(zip(fire_zones, scores))
+        ]
         return sorted(priorities, key=lambda x: x["priority"], reverse=True)
 
     def predict_fire_spread(self, wind, fire_zones):
         """
         Predict the next fire spread zone based on wind direction.
         """
-        predicted_zones = []
-        for zone in fire_zones:
-            if wind["direction"] == "north":
-                predicted_zones.append({"x": zone["x"], "y": zone["y"] - 1})
-            elif wind["direction"] == "south":
-                predicted_zones.append({"x": zone["x"], "y": zone["y"] + 1})
-            elif wind["direction"] == "east":
-                predicted_zones.append({"x": zone["x"] + 1, "y": zone["y"]})
-            elif wind["direction"] == "west":
-                predicted_zones.append({"x": zone["x"] - 1, "y": zone["y"]})
-        return predicted_zones
+        offset = self.WIND_OFFSETS.get(wind["direction"])
+        if offset is None or not fire_zones:
+            return []
+        # One array add shifts every zone by the wind offset at once.
+        shifted = np.asarray([[zone["x"], zone["y"]] for zone in fire_zones]) + offset
+        return [{"x": x, "y": y} for x, y in shifted.tolist()]
 
     def adjust_observation_radius(self, fire_spread_speed):
         """
@@ -140,49 +351,220 @@ class AdvancedWildfireAdaptationStrategy(Strategy):
         else:
             self.observation_radius = min(self.observation_radius + 1, 15)  # Increase for slower fires
 
-    def allocate_uavs(self, prioritized_zones, uav_positions):
+    def allocate_uavs(self, prioritized_zones, uav_positions, uav_xy=None, zones_xy=None):
         """
         Allocate UAVs to prioritized fire zones.
         """
-        assignments = []
-        for zone in prioritized_zones:
-            nearest_uav = min(
-                uav_positions,
-                key=lambda uav: np.linalg.norm(np.array([zone["zone"]["x"], zone["zone"]["y"]]) - np.array([uav["x"], uav["y"]]))
+        if not prioritized_zones or not uav_positions:
+            return []
+        if zones_xy is not None and all("index" in zone for zone in prioritized_zones):
+            # Reorder the tick's cached zone array instead of restacking dicts.
+            zones_xy = zones_xy[[zone["index"] for zone in prioritized_zones]]
+        else:
+            zones_xy = np.asarray(
+                [[zone["zone"]["x"], zone["zone"]["y"]] for zone in prioritized_zones],
+                dtype=self.COORD_DTYPE,
             )
+        uavs_xy = uav_xy if uav_xy is not None else np.asarray(
+            [[uav["x"], uav["y"]] for uav in uav_positions], dtype=self.COORD_DTYPE)
+        # One (Z, U) squared-distance matrix over all zone/UAV combinations.
+        diff = zones_xy[:, None, :] - uavs_xy[None, :, :]
+        squared_cost = np.einsum("zuk,zuk->zu", diff, diff)
+        # Solve the assignment problem for the top prioritized zones so each
+        # gets a distinct UAV, minimizing total travel instead of greedily
+        # sending the same nearest UAV to several zones. The solver needs
+        # true distances (sum of squares has a different optimum), weighted
+        # by priority so hotter zones get the shorter legs.
+        num_assigned = min(len(prioritized_zones), len(uav_positions))
+        travel_cost = np.sqrt(squared_cost[:num_assigned])
+        priorities = np.asarray(
+            [entry.get("priority", 1.0) for entry in prioritized_zones[:num_assigned]],
+            dtype=self.COORD_DTYPE,
+        )
+        # Clamp priorities well away from zero: a dead zone (intensity 0)
+        # must merely rank last, not overflow the division to inf and make
+        # the solve infeasible.
+        travel_cost /= np.maximum(priorities[:, None], 1e-6)
+        zone_indices, uav_indices = linear_sum_assignment(travel_cost)
+        # argmin is unaffected by the monotonic square, so the fallback can
+        # keep using the squared matrix.
+        nearest_indices = squared_cost.argmin(axis=1)
+        chosen = dict(zip(zone_indices, uav_indices))
+        assignments = []
+        speed = self.max_uav_speed
+        for zone_index, entry in enumerate(prioritized_zones):
+            zone = entry["zone"]
+            # Zones beyond the fleet size fall back to their nearest UAV.
+            uav_index = chosen.get(zone_index, nearest_indices[zone_index])
+            uav = uav_positions[uav_index]
+            if uav["x"] == zone["x"] and uav["y"] == zone["y"]:
+                # Already on station: a move to the current position would
+                # only inflate the execute batch.
+                continue
             assignments.append({
-                "id": nearest_uav["id"],
+                "id": uav["id"],
                 "action": "move",
-                "target": [zone["zone"]["x"], zone["zone"]["y"]],
-                "speed": self.max_uav_speed,
+                "target": [zone["x"], zone["y"]],
+                "speed": speed,
             })
         return assignments
 
-    def detect_collisions(self, uav_details, security_distance):
+    def detect_collisions(self, uav_details, security_distance, uav_xy=None):
         """
         Detect potential UAV collisions based on their proximity.
         """
+        if len(uav_details) < 2:
+            return []
+        if len(uav_details) <= self.SCALAR_THRESHOLD:
+            squared_radius = security_distance ** 2
+            collisions = []
+            for i, uav1 in enumerate(uav_details):
+                x1 = uav1["x"]
+                y1 = uav1["y"]
+                for uav2 in uav_details[i + 1:]:
+                    dx = x1 - uav2["x"]
+                    dy = y1 - uav2["y"]
+                    if dx * dx + dy * dy < squared_radius:
+                        collisions.append((uav1, uav2))
+            return collisions
+        positions = uav_xy if uav_xy is not None else np.asarray(
+            [[uav["x"], uav["y"]] for uav in uav_details], dtype=self.COORD_DTYPE)
+        if len(uav_details) <= self.KDTREE_THRESHOLD:
+            if _HAVE_NUMBA:
+                first, second = _pairwise_close_pairs(positions, security_distance ** 2)
+                return [(uav_details[i], uav_details[j]) for i, j in zip(first, second)]
+            diff = positions[:, None, :] - positions[None, :, :]
+            squared_distances = np.einsum("ijk,ijk->ij", diff, diff)
+            close = np.triu(squared_distances < security_distance ** 2, k=1)
+            pairs = np.argwhere(close)
+        elif len(uav_details) <= self.GRID_THRESHOLD:
+            return self._detect_collisions_grid(uav_details, security_distance)
+        else:
+            tree = cKDTree(positions)
+            pairs = tree.query_pairs(r=security_distance, output_type="ndarray")
+            pairs = self._filter_strictly_within(pairs, positions, security_distance ** 2)
+        return [(uav_details[i], uav_details[j]) for i, j in pairs]
+
+    def _make_collision_detector(self, fleet_size):
+        """
+        Build a collision detector closure specialized for a fixed fleet size.
+
+        The size-tier dispatch in detect_collisions and the squared radius
+        are resolved once here instead of on every tick, and the broadcast
+        tier captures preallocated scratch arrays that are rewritten in
+        place for as long as the fleet size stays constant.
+        """
+        security_distance = self.collision_distance
+        squared_radius = security_distance ** 2
+        if fleet_size < 2:
+            def detector(uav_details, uav_xy):
+                return []
+        elif fleet_size <= self.SCALAR_THRESHOLD:
+            def detector(uav_details, uav_xy):
+                collisions = []
+                for i, uav1 in enumerate(uav_details):
+                    x1 = uav1["x"]
+                    y1 = uav1["y"]
+                    for uav2 in uav_details[i + 1:]:
+                        dx = x1 - uav2["x"]
+                        dy = y1 - uav2["y"]
+                        if dx * dx + dy * dy < squared_radius:
+                            collisions.append((uav1, uav2))
+                return collisions
+        elif fleet_size <= self.KDTREE_THRESHOLD and _HAVE_NUMBA:
+            def detector(uav_details, uav_xy):
+                first, second = _pairwise_close_pairs(uav_xy, squared_radius)
+                return [(uav_details[i], uav_details[j]) for i, j in zip(first, second)]
+        elif fleet_size <= self.KDTREE_THRESHOLD:
+            diff = np.empty((fleet_size, fleet_size, 2), dtype=self.COORD_DTYPE)
+            squared_distances = np.empty((fleet_size, fleet_size), dtype=self.COORD_DTYPE)
+
+            def detector(uav_details, uav_xy):
+                np.subtract(uav_xy[:, None, :], uav_xy[None, :, :], out=diff)
+                np.einsum("ijk,ijk->ij", diff, diff, out=squared_distances)
+                close = np.triu(squared_distances < squared_radius, k=1)
+                return [(uav_details[i], uav_details[j]) for i, j in np.argwhere(close)]
+        elif fleet_size <= self.GRID_THRESHOLD:
+            def detector(uav_details, uav_xy):
+                return self._detect_collisions_grid(uav_details, security_distance)
+        else:
+            def detector(uav_details, uav_xy):
+                tree = cKDTree(uav_xy)
+                pairs = tree.query_pairs(r=security_distance, output_type="ndarray")
+                pairs = self._filter_strictly_within(pairs, uav_xy, squared_radius)
+                return [(uav_details[i], uav_details[j]) for i, j in pairs]
+        return detector
+
+    @staticmethod
+    def _filter_strictly_within(pairs, positions, squared_radius):
+        """
+        Drop pairs at exactly the comparison radius: query_pairs is inclusive
+        (distance <= r) while every other tier uses strict <, and exact-radius
+        pairs are common on integer-stepped coordinates.
+        """
+        if not len(pairs):
+            return pairs
+        deltas = positions[pairs[:, 0]] - positions[pairs[:, 1]]
+        return pairs[np.einsum("ij,ij->i", deltas, deltas) < squared_radius]
+
+    def _detect_collisions_grid(self, uav_details, security_distance):
+        """
+        Spatial-hash collision scan: bucket UAVs into cells of side
+        security_distance, then test only pairs in the same or adjacent
+        cells. Each candidate pair is visited exactly once by walking half
+        of the neighborhood.
+        """
+        squared_radius = security_distance ** 2
+        buckets = {}
+        for index, uav in enumerate(uav_details):
+            key = (int(uav["x"] // security_distance), int(uav["y"] // security_distance))
+            buckets.setdefault(key, []).append(index)
         collisions = []
-        for i, uav1 in enumerate(uav_details):
-            for uav2 in uav_details[i + 1:]:
-                distance = np.sqrt((uav1["x"] - uav2["x"]) ** 2 + (uav1["y"] - uav2["y"]) ** 2)
-                if distance < security_distance:
-                    collisions.append((uav1, uav2))
+        forward_neighbors = ((1, 0), (-1, 1), (0, 1), (1, 1))
+        for (cell_x, cell_y), members in buckets.items():
+            # Pairs within the cell itself.
+            for a, i in enumerate(members):
+                uav1 = uav_details[i]
+                for j in members[a + 1:]:
+                    uav2 = uav_details[j]
+                    dx = uav1["x"] - uav2["x"]
+                    dy = uav1["y"] - uav2["y"]
+                    if dx * dx + dy * dy < squared_radius:
+                        collisions.append((uav1, uav2))
+            # Pairs against the forward half of the 8-neighborhood.
+            for offset_x, offset_y in forward_neighbors:
+                others = buckets.get((cell_x + offset_x, cell_y + offset_y))
+                if not others:
+                    continue
+                for i in members:
+                    uav1 = uav_details[i]
+                    for j in others:
+                        uav2 = uav_details[j]
+                        dx = uav1["x"] - uav2["x"]
+                        dy = uav1["y"] - uav2["y"]
+                        if dx * dx + dy * dy < squared_radius:
+                            if i < j:
+                                collisions.append((uav1, uav2))
+                            else:
+                                collisions.append((uav2, uav1))
         return collisions
 
-    def resolve_collision(self, uav1, uav2):
+    def resolve_collision(self, uav1, uav2, offsets=None):
         """
         Generate movement adjustments to resolve UAV collisions.
         """
+        if offsets is None:
+            offsets = self._rng.choice((-1, 1), size=(2, 2))
         adjustments = []
-        for uav in [uav1, uav2]:
+        speed = self.max_uav_speed / 2  # Slow down during collision resolution
+        for uav, (dx, dy) in zip((uav1, uav2), offsets):
             adjustments.append({
                 "id": uav["id"],
                 "action": "move",
                 "target": [
-                    uav["x"] + np.random.choice([-1, 1]),
-                    uav["y"] + np.random.choice([-1, 1]),
+                    uav["x"] + int(dx),
+                    uav["y"] + int(dy),
                 ],
-                "speed": self.max_uav_speed / 2,  # Slow down during collision resolution
+                "speed": speed,
             })
         return adjustments
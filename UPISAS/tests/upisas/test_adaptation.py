@@ -0,0 +1,255 @@
+import json
+import math
+import sys
+import types
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# adaptation.py resolves its base class from a top-level `strategy` module,
+# which is only importable with the UPISAS/ directory itself on sys.path.
+# Register a minimal stand-in so the strategy can be built directly, without
+# an exemplar or a running managed system.
+if "strategy" not in sys.modules:
+    _strategy_stub = types.ModuleType("strategy")
+
+    class _StrategyBase:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    _strategy_stub.Strategy = _StrategyBase
+    sys.modules["strategy"] = _strategy_stub
+
+from UPISAS.adaptation import AdvancedWildfireAdaptationStrategy
+
+
+def brute_force_collisions(uav_details, security_distance):
+    """Reference O(N^2) scan with the strict < the baseline used."""
+    collisions = []
+    for i, uav1 in enumerate(uav_details):
+        for uav2 in uav_details[i + 1:]:
+            if math.dist((uav1["x"], uav1["y"]), (uav2["x"], uav2["y"])) < security_distance:
+                collisions.append((uav1, uav2))
+    return collisions
+
+
+def pair_ids(collisions):
+    return sorted((first["id"], second["id"]) for first, second in collisions)
+
+
+def make_strategy():
+    return AdvancedWildfireAdaptationStrategy(
+        "http://localhost:3000/monitor", "http://localhost:3000/execute", {})
+
+
+def make_response(status_code, content=b"", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestDetectCollisions(unittest.TestCase):
+    """
+    Equivalence of every collision-detection tier with a brute-force scan.
+    """
+
+    def setUp(self):
+        self.strategy = make_strategy()
+
+    def _fleet(self, size, rng):
+        return [{"id": index, "x": float(x), "y": float(y)}
+                for index, (x, y) in enumerate(rng.uniform(0, 100, (size, 2)))]
+
+    def test_all_tiers_match_brute_force(self):
+        rng = np.random.default_rng(42)
+        thresholds = (self.strategy.SCALAR_THRESHOLD,
+                      self.strategy.KDTREE_THRESHOLD,
+                      self.strategy.GRID_THRESHOLD)
+        sizes = {2} | {t for t in thresholds} | {t + 1 for t in thresholds}
+        for size in sorted(sizes):
+            uav_details = self._fleet(size, rng)
+            expected = pair_ids(brute_force_collisions(uav_details, 10))
+            actual = pair_ids(self.strategy.detect_collisions(uav_details, 10))
+            self.assertEqual(actual, expected, f"fleet size {size}")
+
+    def test_exact_radius_pairs_excluded_in_every_tier(self):
+        # UAVs on a line spaced exactly security_distance apart: the strict <
+        # comparison must report no collisions in any size tier.
+        for size in (10, 40, 200, 600):
+            uav_details = [{"id": index, "x": 10.0 * index, "y": 0.0}
+                           for index in range(size)]
+            self.assertEqual(self.strategy.detect_collisions(uav_details, 10), [],
+                             f"fleet size {size}")
+
+    def test_specialized_detector_matches_generic(self):
+        rng = np.random.default_rng(7)
+        for size in (3, 40, 200, 600):
+            uav_details = self._fleet(size, rng)
+            data = {
+                "uav_details": uav_details,
+                "fire_zones": [],
+                "wind": {"active": False, "direction": "none", "velocity": 0},
+                "smoke_active": False,
+                "fire_spread_speed": 2,
+            }
+            expected = pair_ids(brute_force_collisions(
+                uav_details, self.strategy.collision_distance))
+            # Second pass reuses the cached size-specialized closure.
+            for _ in range(2):
+                analysis = self.strategy.analyze(data)
+                self.assertEqual(pair_ids(analysis["collision_warnings"]), expected,
+                                 f"fleet size {size}")
+
+
+class TestMonitorCaching(unittest.TestCase):
+    """
+    Snapshot reuse in monitor(), with the HTTP session stubbed out.
+    """
+
+    PAYLOAD = json.dumps({
+        "constants": {"windDirection": "east", "windVelocity": 1,
+                      "activateWind": True, "fireSpreadSpeed": 2},
+        "dynamicValues": {
+            "uavDetails": [{"id": 0, "x": 1, "y": 2}, {"id": 1, "x": 30, "y": 2}],
+            "fire_zones": [{"x": 5, "y": 5, "intensity": 4}],
+        },
+    }).encode()
+
+    def setUp(self):
+        self.strategy = make_strategy()
+        self.strategy._session = MagicMock()
+
+    def test_parses_fresh_payload(self):
+        self.strategy._session.get.return_value = make_response(200, self.PAYLOAD)
+        snapshot = self.strategy.monitor()
+        self.assertEqual(len(snapshot["uav_details"]), 2)
+        self.assertEqual(snapshot["uav_xy"].shape, (2, 2))
+        self.assertEqual(snapshot["wind"]["direction"], "east")
+
+    def test_identical_payload_reuses_snapshot(self):
+        self.strategy._session.get.return_value = make_response(200, self.PAYLOAD)
+        first = self.strategy.monitor()
+        second = self.strategy.monitor()
+        self.assertIs(second, first)
+
+    def test_304_reuses_snapshot_and_sends_etag(self):
+        self.strategy._session.get.side_effect = [
+            make_response(200, self.PAYLOAD, headers={"ETag": '"abc"'}),
+            make_response(304),
+        ]
+        first = self.strategy.monitor()
+        second = self.strategy.monitor()
+        self.assertIs(second, first)
+        _, kwargs = self.strategy._session.get.call_args
+        self.assertEqual(kwargs["headers"].get("If-None-Match"), '"abc"')
+
+    def test_non_200_raises(self):
+        self.strategy._session.get.return_value = make_response(500)
+        with self.assertRaises(Exception):
+            self.strategy.monitor()
+
+
+class TestExecute(unittest.TestCase):
+    """
+    Both execute() wire formats, with the HTTP session stubbed out.
+    """
+
+    ADJUSTMENTS = [{"id": index, "action": "move", "target": [index, 0], "speed": 2}
+                   for index in range(3)]
+
+    def setUp(self):
+        self.strategy = make_strategy()
+        self.strategy._session = MagicMock()
+        self.strategy._session.put.return_value = make_response(200)
+
+    def test_bulk_mode_sends_one_batched_put(self):
+        self.strategy.execute(self.ADJUSTMENTS)
+        self.strategy._session.put.assert_called_once_with(
+            self.strategy.execute_api, json={"batch": self.ADJUSTMENTS})
+
+    def test_per_adjustment_mode_sends_one_put_each(self):
+        self.strategy.bulk_execute = False
+        self.strategy.execute(self.ADJUSTMENTS)
+        self.assertEqual(self.strategy._session.put.call_count, len(self.ADJUSTMENTS))
+
+    def test_empty_plan_sends_nothing(self):
+        self.strategy.execute([])
+        self.strategy._session.put.assert_not_called()
+
+    def test_non_200_raises(self):
+        self.strategy._session.put.return_value = make_response(500)
+        with self.assertRaises(Exception):
+            self.strategy.execute(self.ADJUSTMENTS)
+
+
+class TestAllocateUavs(unittest.TestCase):
+    """
+    Assignment-solver edge cases in allocate_uavs().
+    """
+
+    def test_zero_intensity_zone_does_not_crash(self):
+        strategy = make_strategy()
+        uav_details = [{"id": 0, "x": 0.0, "y": 0.0}, {"id": 1, "x": 20.0, "y": 0.0}]
+        zones = [{"x": 10.0, "y": 10.0, "intensity": 0}, {"x": 0.0, "y": 5.0, "intensity": 5}]
+        prioritized = strategy.prioritize_fire_zones(zones, uav_details)
+        assignments = strategy.allocate_uavs(prioritized, uav_details)
+        # The dead zone ranks last but still gets a distinct UAV.
+        self.assertEqual(len(assignments), 2)
+        self.assertEqual(sorted(a["id"] for a in assignments), [0, 1])
+
+
+class TestPlan(unittest.TestCase):
+    """
+    Merging of assignments and collision resolutions in plan().
+    """
+
+    def test_collision_resolution_overrides_assignment(self):
+        strategy = make_strategy()
+        uav_details = [{"id": 0, "x": 0.0, "y": 0.0}, {"id": 1, "x": 3.0, "y": 0.0}]
+        zones = [{"x": 0.0, "y": 5.0, "intensity": 5}]
+        prioritized = strategy.prioritize_fire_zones(zones, uav_details)
+        adjustments = strategy.plan({
+            "uav_details": uav_details,
+            "prioritized_zones": prioritized,
+            "collision_warnings": [(uav_details[0], uav_details[1])],
+        })
+        ids = [adjustment["id"] for adjustment in adjustments]
+        self.assertEqual(sorted(ids), [0, 1])
+        # Both UAVs are colliding, so both moves must carry the evasion speed.
+        for adjustment in adjustments:
+            self.assertEqual(adjustment["speed"], strategy.max_uav_speed / 2)
+
+    def test_overflow_zone_does_not_steal_assigned_uav(self):
+        strategy = make_strategy()
+        uav_details = [{"id": 0, "x": 0.0, "y": 0.0}]
+        zones = [{"x": 1.0, "y": 0.0, "intensity": 100},
+                 {"x": 50.0, "y": 0.0, "intensity": 1}]
+        prioritized = strategy.prioritize_fire_zones(zones, uav_details)
+        adjustments = strategy.plan({
+            "uav_details": uav_details,
+            "prioritized_zones": prioritized,
+            "collision_warnings": [],
+        })
+        # The single UAV must serve the high-priority zone; the overflow
+        # zone's fallback move must not replace it.
+        self.assertEqual(len(adjustments), 1)
+        self.assertEqual(adjustments[0]["target"], [1.0, 0.0])
+
+    def test_on_station_uav_gets_no_assignment(self):
+        strategy = make_strategy()
+        uav_details = [{"id": 0, "x": 5.0, "y": 5.0}]
+        zones = [{"x": 5.0, "y": 5.0, "intensity": 5}]
+        prioritized = strategy.prioritize_fire_zones(zones, uav_details)
+        adjustments = strategy.plan({
+            "uav_details": uav_details,
+            "prioritized_zones": prioritized,
+            "collision_warnings": [],
+        })
+        self.assertEqual(adjustments, [])
+
+
+if __name__ == '__main__':
+    unittest.main()